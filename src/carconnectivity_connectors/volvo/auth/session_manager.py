@@ -5,20 +5,21 @@ from typing import TYPE_CHECKING, Tuple
 from enum import Enum
 
 import hashlib
+import functools
 
 import logging
 
 from carconnectivity_connectors.volvo.auth.volvo_session import VolvoSession
 
 if TYPE_CHECKING:
-    from typing import Dict, Any
+    from typing import Dict, Any, Optional, Set
 
 LOG = logging.getLogger("carconnectivity.connectors.volvo.auth")
 
 
-class Service(Enum):
+class Service(str, Enum):
     """
-    An enumeration representing different services.
+    An enumeration representing different services. Members are strings themselves, so they can be used wherever the value is needed.
 
     Attributes:
         VOLVO_CONNECTED_VEHICLE (str): Represents the 'Volvo Connected Vehicle' service.
@@ -36,6 +37,34 @@ class Service(Enum):
         return self.value
 
 
+# Encoded service values, used when hashing so the enum value is not re-encoded on every call
+_SERVICE_BYTES: Dict[Service, bytes] = {service: service.encode('ascii') for service in Service}
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_hash(service: Service, token_key: Tuple[str, str, str]) -> str:
+    """
+    Hashes a service and the key of a session token. Module level function, so the cache does not hold on to any instance.
+
+    Args:
+        service (Service): The service for which the hash is being generated.
+        token_key (Tuple[str, str, str]): Primary api key, secondary api key and access token.
+
+    Returns:
+        str: The generated BLAKE2b hash as a hexadecimal string.
+    """
+    # Feed the parts one by one, this yields the same digest as hashing the concatenated string without building it.
+    # API keys and access tokens (JWT) are ASCII only.
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(_SERVICE_BYTES[service])
+    hasher.update(token_key[0].encode('ascii'))
+    hasher.update(b':')
+    hasher.update(token_key[1].encode('ascii'))
+    hasher.update(b':')
+    hasher.update(token_key[2].encode('ascii'))
+    return hasher.hexdigest()
+
+
 class SessionToken():
     """
     A class to represent a session token.
@@ -49,39 +78,58 @@ class SessionToken():
     -------
     __str__():
         Returns a string representation of the session user in the format 'username:password'.
+    __hash__(), __eq__():
+        Hash and compare by the api keys and access token, so equal tokens share a session.
     """
+    __slots__ = ('vcc_api_key_primary', 'vcc_api_key_secondary', 'access_token', '_key', '_hash', '_str')
+
     def __init__(self, vcc_api_key_primary, vcc_api_key_secondary, access_token: str) -> None:
         self.vcc_api_key_primary: str = vcc_api_key_primary
         self.vcc_api_key_secondary: str = vcc_api_key_secondary
         self.access_token: str = access_token
+        self._key: Tuple[str, str, str] = (vcc_api_key_primary, vcc_api_key_secondary, access_token)
+        self._hash: int = hash(self._key)
+        self._str: str = f'{vcc_api_key_primary}:{vcc_api_key_secondary}:{access_token}'
 
     def __str__(self) -> str:
-        return f'{self.vcc_api_key_primary}:{self.vcc_api_key_secondary}:{self.access_token}'
+        return self._str
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SessionToken):
+            return NotImplemented
+        return self._key == other._key
 
 
 class SessionManager():
     """
     Manages sessions for different services and users, handling token storage and caching.
     """
+    __slots__ = ('tokenstore', 'cache', 'sessions', '_id_cache', '_dirty')
+
     def __init__(self, tokenstore: Dict[str, Any], cache:  Dict[str, Any]) -> None:
         self.tokenstore: Dict[str, Any] = tokenstore
         self.cache: Dict[str, Any] = cache
         self.sessions: Dict[Tuple[Service, SessionToken], VolvoSession] = {}
+        self._id_cache: Dict[Tuple[Service, SessionToken], str] = {}
+        # Sessions that were created or changed their token since the last persist
+        self._dirty: Set[Tuple[Service, SessionToken]] = set()
 
     @staticmethod
     def generate_hash(service: Service, session_token: SessionToken) -> str:
         """
-        Generates a SHA-512 hash for the given service and session user.
+        Generates a BLAKE2b (160 bit) hash for the given service and session user.
 
         Args:
             service (Service): The service for which the hash is being generated.
             session_token (SessionToken): The session token for which the hash is being generated.
 
         Returns:
-            str: The generated SHA-512 hash as a hexadecimal string.
+            str: The generated BLAKE2b hash as a hexadecimal string.
         """
-        hash_str: str = service.value + str(session_token)
-        return hashlib.sha512(hash_str.encode()).hexdigest()
+        return _cached_hash(service, session_token._key)  # pylint: disable=protected-access
 
     @staticmethod
     def generate_identifier(service: Service, session_token: SessionToken) -> str:
@@ -97,6 +145,59 @@ class SessionManager():
         """
         return 'CarConnectivity-connector-volvo:' + SessionManager.generate_hash(service, session_token)
 
+    @staticmethod
+    def _legacy_identifier(service: Service, session_token: SessionToken) -> str:
+        """
+        Generates the identifier used by older versions, based on a SHA-512 hash of the service and the session token.
+
+        Args:
+            service (Service): The service for which the identifier is being generated.
+            session_token (SessionToken): The session token for which the identifier is being generated.
+
+        Returns:
+            str: The legacy identifier string.
+        """
+        return 'CarConnectivity-connector-volvo:' + hashlib.sha512((service.value + str(session_token)).encode()).hexdigest()
+
+    def _migrate_legacy_entries(self, service: Service, session_token: SessionToken, identifier: str) -> None:
+        """
+        Moves the tokenstore and cache entries stored by older versions under the legacy identifier to the current identifier.
+        The legacy entries are removed, so they are not persisted again.
+
+        Args:
+            service (Service): The service of the session.
+            session_token (SessionToken): The session token of the session.
+            identifier (str): The current identifier of the session.
+        """
+        legacy_identifier: str = SessionManager._legacy_identifier(service, session_token)
+        entry: Optional[Any] = self.tokenstore.pop(legacy_identifier, None)
+        if entry is not None:
+            # Older versions stored a dict with token and metadata
+            if isinstance(entry, dict):
+                entry = (entry.get('token'), entry.get('metadata') or {})
+            self.tokenstore[identifier] = entry
+            LOG.info('Migrated tokens from previous version')
+        legacy_cache: Optional[Dict[str, Any]] = self.cache.pop(legacy_identifier, None)
+        if legacy_cache is not None:
+            self.cache[identifier] = legacy_cache
+
+    def _get_identifier(self, service: Service, session_token: SessionToken) -> str:
+        """
+        Returns the identifier for a given service and session token, generating it only on first use.
+
+        Args:
+            service (Service): The service for which the identifier is requested.
+            session_token (SessionToken): The session token for which the identifier is requested.
+
+        Returns:
+            str: The cached unique identifier string.
+        """
+        identifier: Optional[str] = self._id_cache.get((service, session_token))
+        if identifier is None:
+            identifier = SessionManager.generate_identifier(service, session_token)
+            self._id_cache[(service, session_token)] = identifier
+        return identifier
+
     def get_session(self, service: Service, session_token: SessionToken) -> VolvoSession:
         """
         Retrieves a session for the given service and session user. If a session already exists in the sessions cache,
@@ -110,50 +211,58 @@ class SessionManager():
         Returns:
             Session: The session object for the given service and session user.
         """
-        session = None
-        if (service, session_token) in self.sessions:
-            return self.sessions[(service, session_token)]
+        key: Tuple[Service, SessionToken] = (service, session_token)
+        session: Optional[VolvoSession] = self.sessions.get(key)
+        if session is not None:
+            return session
 
-        identifier: str = SessionManager.generate_identifier(service, session_token)
         token = None
-        cache = {}
         metadata = {}
-
-        if identifier in self.tokenstore:
-            if 'token' in self.tokenstore[identifier]:
-                LOG.info('Reusing tokens from previous session')
-                token = self.tokenstore[identifier]['token']
-            if 'metadata' in self.tokenstore[identifier]:
-                metadata = self.tokenstore[identifier]['metadata']
-        if identifier in self.cache:
-            cache = self.cache[identifier]
+        cache: Dict[str, Any] = {}
+
+        # tokenstore and cache are persisted as JSON and need string keys. Only hash when there is something to look up,
+        # otherwise the identifier is generated on first persist.
+        if self.tokenstore or self.cache:
+            identifier: str = self._get_identifier(service, session_token)
+            if identifier not in self.tokenstore and identifier not in self.cache:
+                self._migrate_legacy_entries(service, session_token, identifier)
+            # Entries are (token, metadata) pairs, after loading from JSON they are lists
+            entry: Optional[Tuple[Optional[str], Dict[str, Any]]] = self.tokenstore.get(identifier)
+            if entry is not None:
+                token, metadata = entry
+                if token is not None:
+                    LOG.info('Reusing tokens from previous session')
+            cache = self.cache.get(identifier, cache)
 
         if service == Service.VOLVO_CONNECTED_VEHICLE:
             session = VolvoSession(vcc_api_key_primary=session_token.vcc_api_key_primary, vcc_api_key_secondary=session_token.vcc_api_key_secondary,
-                                   access_token=session_token.access_token, cache=cache)
+                                   access_token=session_token.access_token, cache=cache, metadata=metadata)
         elif service == Service.VOLVO_ENERGY:
             session = VolvoSession(vcc_api_key_primary=session_token.vcc_api_key_primary, vcc_api_key_secondary=session_token.vcc_api_key_secondary,
-                                   access_token=session_token.access_token, cache=cache)
+                                   access_token=session_token.access_token, cache=cache, metadata=metadata)
         elif service == Service.VOLVO_LOCATION:
             session = VolvoSession(vcc_api_key_primary=session_token.vcc_api_key_primary, vcc_api_key_secondary=session_token.vcc_api_key_secondary,
-                                   access_token=session_token.access_token, cache=cache)
+                                   access_token=session_token.access_token, cache=cache, metadata=metadata)
         else:
             raise ValueError(f"Unsupported service: {service}")
 
-        self.sessions[(service, session_token)] = session
+        session.on_token_changed = functools.partial(self._dirty.add, key)
+        self.sessions[key] = session
+        self._dirty.add(key)
         return session
 
     def persist(self) -> None:
         """
         Persist the current sessions into the token store and cache.
 
-        This method iterates over the sessions and stores each session's token and metadata
-        in the token store using a generated identifier. It also stores the session's cache
-        in the cache.
+        This method iterates over the sessions that were created or changed their token since the last
+        call and stores each session's token and metadata in the token store using a generated identifier.
+        It also stores the session's cache in the cache. Sessions that are already persisted keep sharing
+        their cache object with the cache, so later changes to it do not need to be written again.
         """
-        for (service, user), session in self.sessions.items():
-            identifier: str = SessionManager.generate_identifier(service, user)
-            self.tokenstore[identifier] = {}
-            self.tokenstore[identifier]['token'] = session.token
-            self.tokenstore[identifier]['metadata'] = session.metadata
+        for service, user in self._dirty:
+            session: VolvoSession = self.sessions[(service, user)]
+            identifier: str = self._get_identifier(service, user)
+            self.tokenstore[identifier] = (session.token, session.metadata)
             self.cache[identifier] = session.cache
+        self._dirty.clear()
@@ -10,27 +10,40 @@ from oauthlib.oauth2.rfc6749.utils import is_secure_transport
 
 from requests.adapters import HTTPAdapter
 
-from carconnectivity_connectors.volvo.auth.auth_util import add_bearer_auth_header
 from carconnectivity_connectors.volvo.auth.helpers.blacklist_retry import BlacklistRetry
 
 if TYPE_CHECKING:
-    from typing import Dict
+    from typing import Dict, Optional, Callable, Any
 
 LOG = logging.getLogger("carconnectivity.connectors.volvo.auth")
 
+# Size of the connection pools of the retry adapters shared by all sessions
+_POOL_CONNECTIONS: int = 20
+_POOL_MAXSIZE: int = 50
 
-class VolvoSession(requests.Session):
+
+class VolvoSession(requests.Session):  # pylint: disable=too-many-instance-attributes
     """
     VolvoSession is a subclass of requests.Session that handles OAuth Tokens for authentication.
     """
-    def __init__(self, vcc_api_key_primary, vcc_api_key_secondary, access_token, timeout=None, cache=None, **kwargs) -> None:
+    # Retry adapters are reused for all sessions with the same number of retries, so these sessions share one connection pool.
+    # This is the pool used in practice, as the connector sets the retries of every session.
+    _adapter_cache: Dict[int, HTTPAdapter] = {}
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            self, vcc_api_key_primary, vcc_api_key_secondary, access_token, timeout=None, cache=None, metadata=None, **kwargs) -> None:
         super(VolvoSession, self).__init__(**kwargs)
 
         self.timeout = timeout
-        self._access_token = access_token
+        self._access_token: Optional[str] = None
+        self._bearer: Optional[str] = None
         self._retries: bool | int = False
         self.cache = cache
+        self.metadata: Dict[str, Any] = metadata if metadata is not None else {}
+        # Called whenever the token changes, e.g. so the owner can persist it again
+        self.on_token_changed: Optional[Callable[[], None]] = None
         self.headers.update({'vcc-api-key': vcc_api_key_primary})
+        self.token = access_token
 
     @property
     def retries(self) -> bool | int:
@@ -50,19 +63,24 @@ class VolvoSession(requests.Session):
         Args:
             new_retries_value (int): The new number of retries to set. If provided,
                                      configures the session to retry on internal server
-                                     errors (HTTP status code 500) and blacklist status
-                                     code 429 with a backoff factor of 0.1.
+                                     and gateway errors (HTTP status codes 500, 502, 503
+                                     and 504) and blacklist status code 429 with a
+                                     backoff factor of 0.1.
 
         """
         self._retries = new_retries_value
         if new_retries_value:
-            # Retry on internal server error (500)
-            retries = BlacklistRetry(total=new_retries_value,
-                                     backoff_factor=0.1,
-                                     status_forcelist=[500],
-                                     status_blacklist=[429],
-                                     raise_on_status=False)
-            self.mount('https://', HTTPAdapter(max_retries=retries))
+            adapter: Optional[HTTPAdapter] = type(self)._adapter_cache.get(new_retries_value)
+            if adapter is None:
+                # Retry on internal server error (500) and on gateway errors, these are usually transient
+                retries = BlacklistRetry(total=new_retries_value,
+                                         backoff_factor=0.1,
+                                         status_forcelist=[500, 502, 503, 504],
+                                         status_blacklist=[429],
+                                         raise_on_status=False)
+                adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE, max_retries=retries)
+                type(self)._adapter_cache[new_retries_value] = adapter
+            self.mount('https://', adapter)
 
     @property
     def token(self):
@@ -74,6 +92,24 @@ class VolvoSession(requests.Session):
         """
         return self._access_token
 
+    @token.setter
+    def token(self, new_token) -> None:
+        """
+        Set the token and update the Authorization header that is sent with every request.
+
+        Args:
+            new_token (str): The new access token. If None, the Authorization header is removed.
+        """
+        self._access_token = new_token
+        if new_token is None:
+            self._bearer = None
+            self.headers.pop('Authorization', None)
+        else:
+            self._bearer = f'Bearer {new_token}'
+            self.headers['Authorization'] = self._bearer
+        if self.on_token_changed is not None:
+            self.on_token_changed()
+
     def request(  # noqa: C901
         self,
         method,
@@ -85,10 +121,15 @@ class VolvoSession(requests.Session):
         **kwargs
     ) -> requests.Response:
         """Intercept all requests and add the OAuth 2 token if present."""
-        if not is_secure_transport(url):
-            raise InsecureTransportError()
-
-        url, headers, data = self.add_token(url, body=data, headers=headers, token=token)
+        # The session headers already carry the Authorization header, only an explicit token needs per-request headers.
+        # add_token() checks for secure transport itself, so the check is only done here when it is not called.
+        if token is None:
+            if not is_secure_transport(url):
+                raise InsecureTransportError()
+            if self._access_token is None:
+                raise MissingTokenError()
+        else:
+            url, headers, data = self.add_token(url, body=data, headers=headers, token=token)
 
         if timeout is None:
             timeout = self.timeout
@@ -122,10 +163,16 @@ class VolvoSession(requests.Session):
 
         # Only add token if it is not explicitly withheld
         if token is None:
-            if self._access_token is None:
+            if self._bearer is None:
                 raise MissingTokenError()
-            token = self._access_token
-
-        return_headers: Dict[str, str] = add_bearer_auth_header(token, headers)
+            bearer: str = self._bearer
+        else:
+            bearer = 'Bearer ' + token
+
+        if headers is None:
+            return_headers: Dict[str, str] = {'Authorization': bearer}
+        else:
+            return_headers = headers
+            return_headers['Authorization'] = bearer
 
         return (uri, return_headers, body)
@@ -3,14 +3,24 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import threading
+import collections
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import base64
+import io
 import json
+import hashlib
 import os
-import traceback
+import re
 import logging
 import netrc
 from datetime import datetime, timezone, timedelta
+from enum import Enum
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from carconnectivity.garage import Garage
 from carconnectivity.errors import AuthenticationError, TooManyRequestsError, RetrievalError, APIError, APICompatibilityError, \
@@ -47,21 +57,295 @@ from carconnectivity_connectors.volkswagen._version import __version__
 SUPPORT_IMAGES = False
 try:
     from PIL import Image
-    import base64
-    import io
     SUPPORT_IMAGES = True
     from carconnectivity.attributes import ImageAttribute
 except ImportError:
     pass
 
+# Use the faster orjson parser if it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 if TYPE_CHECKING:
-    from typing import Dict, List, Optional, Any, Union
+    from typing import Dict, List, Optional, Any, Union, Tuple, Deque, FrozenSet, Callable, Set, Sequence, Type
+    from concurrent.futures import Future
 
     from carconnectivity.carconnectivity import CarConnectivity
 
 LOG: logging.Logger = logging.getLogger("carconnectivity.connectors.volvo")
 LOG_API: logging.Logger = logging.getLogger("carconnectivity.connectors.volvo-api-debug")
 
+# HTTP status codes checked for every response
+_HTTP_OK = 200
+_HTTP_NO_CONTENT = 204
+_HTTP_MULTI_STATUS = 207
+_HTTP_NOT_MODIFIED = 304
+_HTTP_UNAUTHORIZED = 401
+_HTTP_TOO_MANY_REQUESTS = 429
+# Status codes of responses that carry data
+_HTTP_SUCCESS: FrozenSet[int] = frozenset({_HTTP_OK, _HTTP_MULTI_STATUS})
+
+# Timeout in seconds for downloads through sessions without their own timeout, e.g. vehicle images
+_DOWNLOAD_TIMEOUT: float = 30
+
+# Minimum cache lifetime for resources that rarely change, all other URLs are cached for the configured max_age
+_TTL_RULES: List[Tuple[re.Pattern, timedelta]] = [
+    (re.compile(r'/connected-vehicle/v2/vehicles$'), timedelta(hours=1)),
+    # Vehicle images are addressed by the model configuration and do not change
+    (re.compile(r'^https://cas\.volvocars\.com/'), timedelta(days=7)),
+]
+
+
+def _cache_timestamp(cache: Dict[str, Any], key: str, cache_entry: Sequence[Any]) -> float:
+    """
+    Returns the time a cache entry was stored as POSIX timestamp.
+    Entries written by older versions hold a naive UTC date string instead. These are converted in place, so the string is only
+    parsed once and not on every cache hit.
+
+    Args:
+        cache (Dict[str, Any]): The cache holding the entry.
+        key (str): The key of the entry.
+        cache_entry (Sequence[Any]): The entry, with the stored time as second item.
+
+    Returns:
+        float: Seconds since the epoch.
+    """
+    stored: Union[str, float] = cache_entry[1]
+    if isinstance(stored, str):
+        timestamp: float = datetime.fromisoformat(stored).replace(tzinfo=timezone.utc).timestamp()
+        cache[key] = (cache_entry[0], timestamp, *cache_entry[2:])
+        return timestamp
+    return stored
+
+
+def _bytes_cache_key(url: str) -> str:
+    """
+    Returns the cache key for binary content, a short hash of the URL as e.g. image URLs are several hundred characters long.
+
+    Args:
+        url (str): The URL of the content.
+
+    Returns:
+        str: The key of the cache entry.
+    """
+    return 'sha256:' + hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parses a timestamp as sent by the Volvo API (ISO 8601 in UTC with 'Z' suffix, e.g. 2024-01-01T10:00:00.000Z).
+    Parsing this fixed format directly is considerably faster than robust_time_parse, which is used as fallback for anything else.
+    Results are cached, all windows and doors of a response usually share the same timestamp.
+
+    Args:
+        timestamp (str): The timestamp to parse.
+
+    Returns:
+        datetime: The parsed, timezone aware datetime.
+    """
+    if timestamp.endswith('Z'):
+        try:
+            return datetime.fromisoformat(timestamp[:-1]).replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    return robust_time_parse(timestamp)
+
+
+def _required_timestamp(item: Dict[str, Any], what: str) -> datetime:
+    """
+    Returns the parsed timestamp of an item in an API response.
+
+    Args:
+        item (Dict[str, Any]): The item, e.g. a window or door.
+        what (str): What the item is, used in the error message.
+
+    Raises:
+        APIError: If the item has no timestamp.
+
+    Returns:
+        datetime: The time the item was captured.
+    """
+    if (timestamp := item.get('timestamp')) is None:
+        raise APIError(f'Could not fetch {what}, timestamp missing')
+    return _parse_timestamp(timestamp)
+
+
+def _set_position(position: Position, coordinates: Sequence[float], position_type: Position.PositionType, measured: datetime) -> None:
+    """
+    Sets the coordinates and the type of a position, all measured at the same time.
+
+    Args:
+        position (Position): The position to set.
+        coordinates (Sequence[float]): Longitude, latitude and altitude, in the order of GeoJSON.
+        position_type (Position.PositionType): The type of the position.
+        measured (datetime): When the position was captured.
+    """
+    position.latitude._set_value(coordinates[1], measured=measured)  # pylint: disable=protected-access
+    position.longitude._set_value(coordinates[0], measured=measured)  # pylint: disable=protected-access
+    position.altitude._set_value(coordinates[2], measured=measured)  # pylint: disable=protected-access
+    position.position_type._set_value(position_type, measured=measured)  # pylint: disable=protected-access
+
+
+def _vehicle_url(vehicle: GenericVehicle, vin: str, endpoint: str) -> str:
+    """
+    Returns the URL of an API endpoint for a vehicle. Volvo vehicles keep their URLs, so they are only built once and the same
+    string objects are used as keys for the caches on every poll.
+
+    Args:
+        vehicle (GenericVehicle): The vehicle.
+        vin (str): The VIN of the vehicle.
+        endpoint (str): The endpoint, one of the keys of _VEHICLE_URL_TEMPLATES.
+
+    Returns:
+        str: The URL.
+    """
+    if not isinstance(vehicle, VolvoVehicle):
+        return _VEHICLE_URL_TEMPLATES[endpoint].format(vin=vin)
+    urls: Dict[str, str] = vehicle._urls  # pylint: disable=protected-access
+    url: Optional[str] = urls.get(endpoint)
+    if url is None:
+        url = _VEHICLE_URL_TEMPLATES[endpoint].format(vin=vin)
+        urls[endpoint] = url
+    return url
+
+
+def _clear_position(position: Position) -> None:
+    """
+    Resets the coordinates and the type of a position, used when the API returns no usable position.
+
+    Args:
+        position (Position): The position to reset.
+    """
+    position.latitude._set_value(None)  # pylint: disable=protected-access
+    position.longitude._set_value(None)  # pylint: disable=protected-access
+    position.altitude._set_value(None)  # pylint: disable=protected-access
+    position.position_type._set_value(None)  # pylint: disable=protected-access
+
+
+def _set_if_changed(attribute: GenericAttribute, value: Any) -> None:
+    """
+    Sets the value of an attribute only if it differs from the current value. Used for static vehicle properties, so observers
+    are not notified about an update on every fetch.
+
+    Args:
+        attribute (GenericAttribute): The attribute to set.
+        value (Any): The new value.
+    """
+    if attribute.value != value:
+        attribute._set_value(value)  # pylint: disable=protected-access
+
+
+# Errors raised by requests that are reported as RetrievalError, with the prefix used in the error message.
+# The order matters, e.g. ConnectTimeout is a ConnectionError as well as a Timeout.
+_REQUEST_ERROR_MESSAGES: Dict[Type[Exception], str] = {
+    requests.exceptions.ConnectionError: 'Connection error',
+    requests.exceptions.ChunkedEncodingError: 'Error',
+    requests.exceptions.ReadTimeout: 'Timeout during read',
+    requests.exceptions.RetryError: 'Retrying failed',
+}
+_REQUEST_ERRORS: Tuple[Type[Exception], ...] = tuple(_REQUEST_ERROR_MESSAGES.keys())
+
+
+def _retrieval_error(error: requests.exceptions.RequestException) -> RetrievalError:
+    """
+    Converts an error raised by requests into a RetrievalError.
+
+    Args:
+        error (requests.exceptions.RequestException): One of the errors in _REQUEST_ERRORS.
+
+    Returns:
+        RetrievalError: The error to raise instead.
+    """
+    message: str = next(message for error_type, message in _REQUEST_ERROR_MESSAGES.items() if isinstance(error, error_type))
+    return RetrievalError(f'{message}: {error}')
+
+
+# Enum members by name, the API values are looked up here
+_GEARBOX_TYPES: Dict[str, GenericVehicle.VehicleSpecification.GearboxType] = \
+    {item.name: item for item in GenericVehicle.VehicleSpecification.GearboxType}
+_VEHICLE_TYPES: Dict[str, GenericVehicle.Type] = {item.name: item for item in GenericVehicle.Type}
+_WINDOW_OPEN_STATES: Dict[str, Windows.OpenState] = {item.name: item for item in Windows.OpenState}
+_DOOR_OPEN_STATES: Dict[str, Doors.OpenState] = {item.name: item for item in Doors.OpenState}
+# Door states that count as an open door for the state of all doors
+_OPEN_DOOR_STATES: FrozenSet[Doors.OpenState] = frozenset({Doors.OpenState.OPEN, Doors.OpenState.AJAR})
+
+# How errors during the periodic update are handled: Seconds to wait before the next try (None for the configured interval) and the
+# message to log. Looked up along the class hierarchy, so the most specific entry wins.
+_UPDATE_ERROR_HANDLING: Dict[Type[Exception], Tuple[Optional[float], str]] = {
+    TooManyRequestsError: (900, 'Retrieval error during update. Too many requests from your account (%(error)s). Will try again after 15 minutes'),
+    RetrievalError: (None, 'Retrieval error during update (%(error)s). Will try again after configured interval of %(interval)ss'),
+    APICompatibilityError: (None, 'API compatability error during update (%(error)s). Will try again after configured interval of %(interval)ss'),
+    TemporaryAuthenticationError: (None, 'Temporary authentification error during update (%(error)s). '
+                                         'Will try again after configured interval of %(interval)ss'),
+}
+_UPDATE_ERRORS: Tuple[Type[Exception], ...] = tuple(_UPDATE_ERROR_HANDLING.keys())
+
+
+def _update_error_handling(error: Exception) -> Tuple[Optional[float], str]:
+    """
+    Returns how to handle an error raised during the periodic update.
+
+    Args:
+        error (Exception): The error, an instance of one of the classes in _UPDATE_ERRORS.
+
+    Returns:
+        Tuple[Optional[float], str]: Seconds to wait (None for the configured interval) and the message to log.
+    """
+    return next(_UPDATE_ERROR_HANDLING[error_class] for error_class in type(error).__mro__ if error_class in _UPDATE_ERROR_HANDLING)
+
+
+# Keys of the vehicle details that are handled, others are reported by log_extra_keys
+_VEHICLE_DETAIL_KEYS: FrozenSet[str] = frozenset({'vin', 'modelYear', 'gearbox', 'descriptions', 'images'})
+_DESCRIPTION_KEYS: FrozenSet[str] = frozenset({'model', 'steering'})
+
+
+class FetchResult(Enum):
+    """
+    Markers returned by _fetch_data instead of data.
+
+    Attributes:
+        NOT_MODIFIED (str): The server confirmed that the data did not change since it was last returned.
+    """
+    NOT_MODIFIED = 'not_modified'
+
+
+# Vehicle class a vehicle is promoted to once its type is known
+_VEHICLE_CLASS_FOR_TYPE: Dict[GenericVehicle.Type, Type[VolvoVehicle]] = {
+    GenericVehicle.Type.ELECTRIC: VolvoElectricVehicle,
+    GenericVehicle.Type.FUEL: VolvoCombustionVehicle,
+    GenericVehicle.Type.GASOLINE: VolvoCombustionVehicle,
+    GenericVehicle.Type.PETROL: VolvoCombustionVehicle,
+    GenericVehicle.Type.DIESEL: VolvoCombustionVehicle,
+    GenericVehicle.Type.CNG: VolvoCombustionVehicle,
+    GenericVehicle.Type.LPG: VolvoCombustionVehicle,
+    GenericVehicle.Type.HYBRID: VolvoHybridVehicle,
+}
+
+_STEERING_MAP: Dict[str, GenericVehicle.VehicleSpecification.SteeringPosition] = {
+    'LEFT': GenericVehicle.VehicleSpecification.SteeringPosition.LEFT,
+    'RIGHT': GenericVehicle.VehicleSpecification.SteeringPosition.RIGHT,
+}
+
+_LOCK_STATE_MAP: Dict[str, Doors.LockState] = {
+    'LOCKED': Doors.LockState.LOCKED,
+    'UNLOCKED': Doors.LockState.UNLOCKED,
+}
+
+# URLs of the per vehicle API endpoints
+_VEHICLE_URL_TEMPLATES: Dict[str, str] = {
+    'location': 'https://api.volvocars.com/location/v1/vehicles/{vin}/location',
+    'windows': 'https://api.volvocars.com/connected-vehicle/v2/vehicles/{vin}/windows',
+    'doors': 'https://api.volvocars.com/connected-vehicle/v2/vehicles/{vin}/doors',
+    'odometer': 'https://api.volvocars.com/connected-vehicle/v2/vehicles/{vin}/odometer',
+}
+
+_LENGTH_UNIT_MAP: Dict[str, Length] = {
+    'km': Length.KM,
+}
+
 
 # pylint: disable=too-many-lines
 class Connector(BaseConnector):
@@ -78,7 +362,8 @@ class Connector(BaseConnector):
                                *args, initialization=initialization, **kwargs)
 
         self._background_thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
+        self._stopped: bool = False
+        self._wake: threading.Condition = threading.Condition()
 
         self.connection_state: EnumAttribute[ConnectionState] = EnumAttribute(name="connection_state", parent=self, value_type=ConnectionState,
                                                                               value=ConnectionState.DISCONNECTED, tags={'connector_custom'})
@@ -90,25 +375,22 @@ class Connector(BaseConnector):
 
         LOG.info("Loading volvo connector with config %s", config_remove_credentials(config))
 
-        if 'vcc_api_key_primary' in config and config['vcc_api_key_primary'] is not None:
-            self.active_config['vcc_api_key_primary'] = config['vcc_api_key_primary']
+        if (value := config.get('vcc_api_key_primary')) is not None:
+            self.active_config['vcc_api_key_primary'] = value
         else:
             raise AuthenticationError('vcc_api_key_primary was not found in config')
 
-        if 'vcc_api_key_secondary' in config and config['vcc_api_key_secondary'] is not None:
-            self.active_config['vcc_api_key_secondary'] = config['vcc_api_key_secondary']
+        if (value := config.get('vcc_api_key_secondary')) is not None:
+            self.active_config['vcc_api_key_secondary'] = value
         else:
             raise AuthenticationError('vcc_api_key_secondary was not found in config')
         
-        if 'connected_vehicle_token' in config and config['connected_vehicle_token'] is not None:
-            self.active_config['connected_vehicle_token'] = config['connected_vehicle_token']
+        if (value := config.get('connected_vehicle_token')) is not None:
+            self.active_config['connected_vehicle_token'] = value
         else:
             raise AuthenticationError('connected_vehicle_token was not found in config')
 
-        if 'location_token' in config and config['location_token'] is not None:
-            self.active_config['location_token'] = config['location_token']
-        else:
-            self.active_config['location_token'] = None
+        self.active_config['location_token'] = config.get('location_token')
 
         self.active_config['interval'] = 180
         if 'interval' in config:
@@ -118,6 +400,17 @@ class Connector(BaseConnector):
         self.active_config['max_age'] = self.active_config['interval'] - 1
         if 'max_age' in config:
             self.active_config['max_age'] = config['max_age']
+        self._max_age_delta: Optional[timedelta] = None
+        if self.active_config['max_age'] is not None:
+            self._max_age_delta = timedelta(seconds=self.active_config['max_age'])
+        self._ttl_rule_by_url: Dict[str, Optional[timedelta]] = {}
+        # URLs whose data was already returned by _fetch_data, only for these FetchResult.NOT_MODIFIED can be returned
+        self._delivered_urls: Set[str] = set()
+        # Model, equipment and images of a vehicle do not change, so its details are only fetched once a day by default
+        self.active_config['vehicle_detail_max_age'] = 86400
+        if 'vehicle_detail_max_age' in config:
+            self.active_config['vehicle_detail_max_age'] = config['vehicle_detail_max_age']
+        self._vehicle_detail_max_age: timedelta = timedelta(seconds=self.active_config['vehicle_detail_max_age'] or 0)
         self.interval._set_value(timedelta(seconds=self.active_config['interval']))  # pylint: disable=protected-access
 
         self._manager: SessionManager = SessionManager(tokenstore=car_connectivity.get_tokenstore(), cache=car_connectivity.get_cache())
@@ -144,19 +437,59 @@ class Connector(BaseConnector):
         else:
             self.location_session = None
 
-        self._elapsed: List[timedelta] = []
+        # Only the most recent request durations are kept, the connector runs for a long time
+        self._elapsed: Deque[timedelta] = collections.deque(maxlen=1024)
+
+        # Vehicle images are downloaded from a different host without authentication, keep the connections to it alive
+        self._image_session: requests.Session = requests.Session()
+        # We need to pretend to be a browser to get the images
+        self._image_session.headers['user-agent'] = 'Safari/605.1.15'
+        self._image_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.3)))
+        # Threads of both pools, shutdown must not wait for a pool from one of its own threads
+        self._worker_threads: Set[threading.Thread] = set()
+        # Image downloads are independent of each other and only wait for the network
+        self._image_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='carconnectivity.connectors.volvo-images',
+                                                                  initializer=self._register_worker_thread)
+        # Requests for different vehicles are independent of each other and are sent in parallel
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='carconnectivity.connectors.volvo-worker',
+                                                                initializer=self._register_worker_thread)
+
+    def _register_worker_thread(self) -> None:
+        """
+        Remembers the current thread as a thread of one of the connector's pools.
+
+        Returns:
+            None
+        """
+        self._worker_threads.add(threading.current_thread())
 
     def startup(self) -> None:
+        self._stopped = False
         self._background_thread = threading.Thread(target=self._background_loop, daemon=False)
         self._background_thread.name = 'carconnectivity.connectors.volvo-background'
         self._background_thread.start()
         self.healthy._set_value(value=True)  # pylint: disable=protected-access
 
+    def _wait(self, timeout: float) -> None:
+        """
+        Waits for the given time or until the connector is shut down.
+
+        Args:
+            timeout (float): The time to wait in seconds.
+        """
+        with self._wake:
+            # Checked under the lock, so a shutdown between two waits is not missed
+            if not self._stopped:
+                self._wake.wait(timeout=timeout)
+
     def _background_loop(self) -> None:
-        self._stop_event.clear()
         fetch: bool = True
-        self.connection_state._set_value(value=ConnectionState.CONNECTING)  # pylint: disable=protected-access
-        while not self._stop_event.is_set():
+        # Bound once, the loop runs for the whole lifetime of the connector
+        set_connection_state = self.connection_state._set_value  # pylint: disable=protected-access
+        set_last_update = self.last_update._set_value  # pylint: disable=protected-access
+        wait = self._wait
+        set_connection_state(value=ConnectionState.CONNECTING)
+        while not self._stopped:
             interval = 300
             try:
                 try:
@@ -165,40 +498,30 @@ class Connector(BaseConnector):
                         fetch = False
                     else:
                         self.update_vehicles()
-                    self.last_update._set_value(value=datetime.now(tz=timezone.utc))  # pylint: disable=protected-access
+                        # Observers registered for the end of a transaction are notified once per update, as after fetch_all
+                        self.car_connectivity.transaction_end()
+                    set_last_update(value=datetime.now(tz=timezone.utc))
                     if self.interval.value is not None:
                         interval: float = self.interval.value.total_seconds()
                 except Exception:
-                    self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
+                    # Every error ends up here first, the handlers below only need to log and wait
+                    set_connection_state(value=ConnectionState.ERROR)
                     if self.interval.value is not None:
                         interval: float = self.interval.value.total_seconds()
                     raise
-            except TooManyRequestsError as err:
-                LOG.error('Retrieval error during update. Too many requests from your account (%s). Will try again after 15 minutes', str(err))
-                self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
-                self._stop_event.wait(900)
-            except RetrievalError as err:
-                LOG.error('Retrieval error during update (%s). Will try again after configured interval of %ss', str(err), interval)
-                self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
-                self._stop_event.wait(interval)
-            except APICompatibilityError as err:
-                LOG.error('API compatability error during update (%s). Will try again after configured interval of %ss', str(err), interval)
-                self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
-                self._stop_event.wait(interval)
-            except TemporaryAuthenticationError as err:
-                LOG.error('Temporary authentification error during update (%s). Will try again after configured interval of %ss', str(err), interval)
-                self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
-                self._stop_event.wait(interval)
+            except _UPDATE_ERRORS as err:
+                wait_seconds, message = _update_error_handling(err)
+                LOG.error(message, {'error': str(err), 'interval': interval})
+                wait(interval if wait_seconds is None else wait_seconds)
             except Exception as err:
-                LOG.critical('Critical error during update: %s', traceback.format_exc())
+                LOG.critical('Critical error during update', exc_info=True)
                 self.healthy._set_value(value=False)  # pylint: disable=protected-access
-                self.connection_state._set_value(value=ConnectionState.ERROR)  # pylint: disable=protected-access
                 raise err
             else:
-                self.connection_state._set_value(value=ConnectionState.CONNECTED)  # pylint: disable=protected-access
-                self._stop_event.wait(interval)
+                set_connection_state(value=ConnectionState.CONNECTED)
+                wait(interval)
         # When leaving the loop, set the connection state to disconnected
-        self.connection_state._set_value(value=ConnectionState.DISCONNECTED)  # pylint: disable=protected-access
+        set_connection_state(value=ConnectionState.DISCONNECTED)
 
     def persist(self) -> None:
         """
@@ -227,10 +550,20 @@ class Connector(BaseConnector):
             if len(vehicle.managing_connectors) == 1 and self in vehicle.managing_connectors:
                 self.car_connectivity.garage.remove_vehicle(vehicle.id)
                 vehicle.enabled = False
-        self._stop_event.set()
+        with self._wake:
+            self._stopped = True
+            self._wake.notify_all()
         self.connected_vehicle_session.close()
-        if self._background_thread is not None:
+        self._image_session.close()
+        # The loop is already woken up. Joining is only needed while it still runs and not possible from the thread itself,
+        # e.g. when shutdown is triggered by an observer during an update.
+        if self._background_thread is not None and self._background_thread.is_alive() \
+                and self._background_thread is not threading.current_thread():
             self._background_thread.join()
+        # Waiting for the pools from one of their own threads would never return, the pools then only stop accepting work
+        in_worker: bool = threading.current_thread() in self._worker_threads
+        self._image_pool.shutdown(wait=not in_worker)
+        self._executor.shutdown(wait=not in_worker)
         self.persist()
         BaseConnector.shutdown(self)
 
@@ -238,9 +571,10 @@ class Connector(BaseConnector):
         """
         Fetches all necessary data for the connector.
 
-        This method calls the `fetch_vehicles` method to retrieve vehicle data.
+        This method calls the `fetch_vehicles` method to retrieve the vehicles and `update_vehicles` to retrieve their status.
         """
         self.fetch_vehicles()
+        self.update_vehicles()
         self.car_connectivity.transaction_end()
 
     def update_vehicles(self) -> None:
@@ -256,15 +590,39 @@ class Connector(BaseConnector):
             None
         """
         garage: Garage = self.car_connectivity.garage
-        for vin in set(garage.list_vehicle_vins()):
-            vehicle_to_update: Optional[GenericVehicle] = garage.get_vehicle(vin)
-            if vehicle_to_update is not None and isinstance(vehicle_to_update, GenericVehicle) and vehicle_to_update.is_managed_by_connector(self):
-                vehicle_to_update = self.fetch_odometer(vehicle_to_update)
-                vehicle_to_update = self.fetch_windows(vehicle_to_update)
-                vehicle_to_update = self.fetch_doors(vehicle_to_update)
-                if self.location_session is not None:
-                    vehicle_to_update = self.fetch_position(vehicle_to_update)
-                self.decide_state(vehicle_to_update)
+        # Vehicles are unique in the garage, no need to deduplicate or look them up again by VIN
+        vehicles_to_update: List[GenericVehicle] = [vehicle for vehicle in garage.list_vehicles()
+                                                    if isinstance(vehicle, GenericVehicle) and vehicle.is_managed_by_connector(self)]
+        endpoints: List[Tuple[str, VolvoSession, Callable[[GenericVehicle, Union[Dict[str, Any], None, FetchResult]], GenericVehicle]]] = [
+            ('odometer', self.connected_vehicle_session, self._update_odometer),
+            ('windows', self.connected_vehicle_session, self._update_windows),
+            ('doors', self.connected_vehicle_session, self._update_doors),
+        ]
+        if self.location_session is not None:
+            endpoints.append(('location', self.location_session, self._update_position))
+        # All endpoints of all vehicles are independent of each other, so every request is sent right away. Only the requests run on the
+        # worker pool, the responses are applied on this thread, so attribute observers are never called from a worker.
+        # The state of a vehicle is decided once all of its data is there.
+        requests_by_vehicle: List[Tuple[GenericVehicle, List[Tuple[str, Callable, Future]]]] = []
+        try:
+            for vehicle in vehicles_to_update:
+                vehicle_requests: List[Tuple[str, Callable, Future]] = []
+                requests_by_vehicle.append((vehicle, vehicle_requests))
+                for endpoint, session, update in endpoints:
+                    url: str = self._status_url(vehicle, endpoint)
+                    vehicle_requests.append((url, update, self._executor.submit(self._fetch_data, url, session, allow_empty=True,
+                                                                                allow_not_modified=True)))
+            for vehicle, vehicle_requests in requests_by_vehicle:
+                for url, update, future in vehicle_requests:
+                    # Re-raises the error of the worker
+                    self._apply_status(vehicle, url, future.result(), update)
+                self.decide_state(vehicle)
+        except Exception:
+            # Requests that did not start yet are dropped, e.g. the API should not be asked again right after answering 429
+            for _, vehicle_requests in requests_by_vehicle:
+                for _, _, future in vehicle_requests:
+                    future.cancel()
+            raise
 
     def fetch_vehicles(self) -> None:
         """
@@ -280,135 +638,134 @@ class Connector(BaseConnector):
         # {'data': [{'vin': 'YV4952NA4F120DEMO'}, {'vin': 'LPSEFAVS2NPOLDEMO'}]}
         data: Dict[str, Any] | None = self._fetch_data(url, session=self.connected_vehicle_session)
 
+        # VINs that are not seen in the response anymore are removed at the end
+        stale_vehicle_vins: set[str] = set(garage.list_vehicle_vins())
         seen_vehicle_vins: set[str] = set()
-        if data is not None:
-            if 'data' in data and data['data'] is not None:
-                for vehicle_dict in data['data']:
-                    if 'vin' in vehicle_dict and vehicle_dict['vin'] is not None:
-                        if vehicle_dict['vin'] in self.active_config['hide_vins']:
-                            LOG.warning('Vehicle %s is hidden in config', vehicle_dict['vin'])
-                            continue
-                        vin: str = vehicle_dict['vin']
-                        seen_vehicle_vins.add(vin)
-                        vehicle: Optional[GenericVehicle] = garage.get_vehicle(vin)  # pyright: ignore[reportAssignmentType]
-                        if vehicle is None:
-                            vehicle = VolvoVehicle(vin=vin, garage=garage, managing_connector=self, initialization=garage.get_initialization(vin))
-                            garage.add_vehicle(vin, vehicle)
-
-                        url = f'https://api.volvocars.com/connected-vehicle/v2/vehicles/{vin}'
-                        # {'data': {'vin': 'YV4952NA4F120DEMO', 'modelYear': 2019, 'gearbox': 'AUTOMATIC', 'fuelType': 'DIESEL', 'externalColour': 'SAVILE GREY', 'batteryCapacityKWH': 78.0, 'images': {'exteriorImageUrl': 'https://cas.volvocars.com/image/vbsnext-v4/exterior/MY19_1817/225/A8/13/49200/R131/_/TP02/_/_/TM02/JT02_f13/SR02/_/_/JB0C/T206/default.png?market=us&client=connected-vehicle-api&w=1920&bg=00000000&angle=0&fallback', 'internalImageUrl': 'https://cas.volvocars.com/image/vbsnext-v4/interior/MY19_1817/225/1/RC0000_f13/NC04/DI02/RU06/_/_/FJ01/EV02/K502/default.png?market=us&client=connected-vehicle-api&w=1920&bg=00000000&angle=0&fallback'}, 'descriptions': {'model': 'V60 II', 'upholstery': 'CHARCOAL/LEAC/CHARC', 'steering': 'LEFT'}}}
-                        vehicle_data: Dict[str, Any] | None = self._fetch_data(url, session=self.connected_vehicle_session)
-
-                        if vehicle_data is not None and 'data' in vehicle_data and vehicle_data['data'] is not None:
-                            if 'modelYear' in vehicle_data['data'] and vehicle_data['data']['modelYear'] is not None:
-                                vehicle.model_year._set_value(vehicle_data['data']['modelYear'])  # pylint: disable=protected-access
-
-                            if 'gearbox' in vehicle_data['data'] and vehicle_data['data']['gearbox'] is not None:
-                                if vehicle_data['data']['gearbox'] in [item.name for item in GenericVehicle.VehicleSpecification.GearboxType]:
-                                    gearbox_type: GenericVehicle.VehicleSpecification.GearboxType = \
-                                        GenericVehicle.VehicleSpecification.GearboxType[vehicle_data['data']['gearbox']]
-                                    vehicle.specification.gearbox._set_value(gearbox_type)  # pylint: disable=protected-access
-                                else:
-                                    vehicle.specification.gearbox._set_value(GenericVehicle.VehicleSpecification.GearboxType.UNKNOWN)  # pylint: disable=protected-access
-                                    LOG_API.warning('Unknown gearbox type: %s', vehicle_data['data']['gearbox'])
-                            
-                            if 'fuelType' in vehicle_data['data'] and vehicle_data['data']['fuelType'] is not None:
-                                if vehicle_data['data']['fuelType'] in [item.name for item in GenericVehicle.Type]:
-                                    car_type: GenericVehicle.Type = GenericVehicle.Type[vehicle_data['data']['fuelType']]
-                                    vehicle.type._set_value(car_type)  # pylint: disable=protected-access
-                                elif vehicle_data['data']['fuelType'] == 'PETROL/ELECTRIC':
-                                    vehicle.type._set_value(GenericVehicle.Type.HYBRID)  # pylint: disable=protected-access
-                                else:
-                                    vehicle.type._set_value(GenericVehicle.Type.UNKNOWN)  # pylint: disable=protected-access
-                                    LOG_API.warning('Unknown fuel type: %s', vehicle_data['data']['fuelType'])
-                                if vehicle.type.value == GenericVehicle.Type.ELECTRIC and not isinstance(vehicle, VolvoElectricVehicle):
-                                    LOG.debug('Promoting %s to VolvoElectricVehicle object for %s', vehicle.__class__.__name__, vin)
-                                    vehicle = VolvoElectricVehicle(garage=self.car_connectivity.garage, origin=vehicle)
-                                    self.car_connectivity.garage.replace_vehicle(vin, vehicle)
-                                elif vehicle.type.value in [GenericVehicle.Type.FUEL,
-                                                GenericVehicle.Type.GASOLINE,
-                                                GenericVehicle.Type.PETROL,
-                                                GenericVehicle.Type.DIESEL,
-                                                GenericVehicle.Type.CNG,
-                                                GenericVehicle.Type.LPG] \
-                                        and not isinstance(vehicle, VolvoCombustionVehicle):
-                                    LOG.debug('Promoting %s to VolvoCombustionVehicle object for %s', vehicle.__class__.__name__, vin)
-                                    vehicle = VolvoCombustionVehicle(garage=self.car_connectivity.garage, origin=vehicle)
-                                    self.car_connectivity.garage.replace_vehicle(vin, vehicle)
-                                elif vehicle.type.value == GenericVehicle.Type.HYBRID and not isinstance(vehicle, VolvoHybridVehicle):
-                                    LOG.debug('Promoting %s to VolvoHybridVehicle object for %s', vehicle.__class__.__name__, vin)
-                                    vehicle = VolvoHybridVehicle(garage=self.car_connectivity.garage, origin=vehicle)
-                                    self.car_connectivity.garage.replace_vehicle(vin, vehicle)
-                            
-                            if 'descriptions' in vehicle_data['data'] and vehicle_data['data']['descriptions'] is not None:
-                                if 'model' in vehicle_data['data']['descriptions'] and vehicle_data['data']['descriptions']['model'] is not None:
-                                    vehicle.model._set_value(vehicle_data['data']['descriptions']['model'])  # pylint: disable=protected-access
-                                
-                                if 'steering' in vehicle_data['data']['descriptions'] and vehicle_data['data']['descriptions']['steering'] is not None:
-                                    if vehicle_data['data']['descriptions']['steering'] == 'LEFT':
-                                        # pylint: disable-next=protected-access
-                                        vehicle.specification.steering_wheel_position._set_value(GenericVehicle.VehicleSpecification.SteeringPosition.LEFT)
-                                    elif vehicle_data['data']['descriptions']['steering'] == 'RIGHT':
-                                        # pylint: disable-next=protected-access
-                                        vehicle.specification.steering_wheel_position._set_value(GenericVehicle.VehicleSpecification.SteeringPosition.RIGHT)
-                                    else:
-                                        # pylint: disable-next=protected-access
-                                        vehicle.specification.steering_wheel_position._set_value(GenericVehicle.VehicleSpecification.SteeringPosition.UNKNOWN)
-                                        LOG_API.warning('Unknown steering position: %s', vehicle_data['data']['descriptions']['steering'])
-                                log_extra_keys(LOG_API, 'descriptions', vehicle_data['data']['descriptions'], {'model', 'steering'})
-
-                            if SUPPORT_IMAGES and 'images' in vehicle_data['data'] and vehicle_data['data']['images'] is not None:
-                                # fetch vehcile images
-                                for image_id, image_url in vehicle_data['data']['images'].items():
-                                    img = None
-                                    cache_date = None
-                                    if self.active_config['max_age'] is not None and self.connected_vehicle_session.cache is not None and image_url in self.connected_vehicle_session.cache:
-                                        img, cache_date_string = self.connected_vehicle_session.cache[image_url]
-                                        img = base64.b64decode(img)  # pyright: ignore[reportPossiblyUnboundVariable]
-                                        img = Image.open(io.BytesIO(img))  # pyright: ignore[reportPossiblyUnboundVariable]
-                                        cache_date = datetime.fromisoformat(cache_date_string)
-                                    if img is None or self.active_config['max_age'] is None \
-                                            or (cache_date is not None and cache_date < (datetime.utcnow() - timedelta(seconds=self.active_config['max_age']))):
-                                        try:
-                                            headers = dict()
-                                            # We need to pretend to be a browser to get the images
-                                            headers['user-agent'] = 'Safari/605.1.15'
-                                            image_download_response = requests.get(image_url, headers=headers, stream=True)
-                                            if image_download_response.status_code == requests.codes['ok']:
-                                                img = Image.open(image_download_response.raw)  # pyright: ignore[reportPossiblyUnboundVariable]
-                                                if self.connected_vehicle_session.cache is not None:
-                                                    buffered = io.BytesIO()  # pyright: ignore[reportPossiblyUnboundVariable]
-                                                    img.save(buffered, format="PNG")
-                                                    img_str = base64.b64encode(buffered.getvalue()).decode("utf-8")  # pyright: ignore[reportPossiblyUnboundVariable]
-                                                    self.connected_vehicle_session.cache[image_url] = (img_str, str(datetime.utcnow()))
-                                            else:
-                                                print(f'Error: {image_download_response.text}')
-                                                print(f'Error: {image_download_response.request.headers}')
-                                        except requests.exceptions.ConnectionError as connection_error:
-                                            raise RetrievalError(f'Connection error: {connection_error}') from connection_error
-                                        except requests.exceptions.ChunkedEncodingError as chunked_encoding_error:
-                                            raise RetrievalError(f'Error: {chunked_encoding_error}') from chunked_encoding_error
-                                        except requests.exceptions.ReadTimeout as timeout_error:
-                                            raise RetrievalError(f'Timeout during read: {timeout_error}') from timeout_error
-                                        except requests.exceptions.RetryError as retry_error:
-                                            raise RetrievalError(f'Retrying failed: {retry_error}') from retry_error
-                                    if img is not None:
-                                        vehicle._car_images[image_id] = img  # pylint: disable=protected-access
-                                        if image_id == 'exteriorImageUrl':
-                                            if 'car_picture' in vehicle.images.images:
-                                                vehicle.images.images['car_picture']._set_value(img)  # pylint: disable=protected-access
-                                            else:
-                                                vehicle.images.images['car_picture'] = ImageAttribute(name="car_picture", parent=vehicle.images,
-                                                                                                      value=img, tags={'carconnectivity'})
-                            log_extra_keys(LOG_API, 'https://api.volvocars.com/connected-vehicle/v2/vehicles/{vin}', vehicle_data['data'],
-                                           {'vin', 'modelYear', 'gearbox', 'descriptions', 'images'})
+        vehicle_list: Optional[List[Dict[str, Any]]] = data.get('data') if data is not None else None
+        if vehicle_list is not None:
+            hide_vins = self.active_config['hide_vins']
+            # Bound once, they are used for every vehicle in the loop below
+            get_vehicle = garage.get_vehicle
+            submit_image = self._image_pool.submit
+            fetch_image = self._fetch_cached_bytes
+            image_session: requests.Session = self._image_session
+            image_cache: Dict[str, Any] = self.connected_vehicle_session.cache
+            # The detail requests are independent of each other, so they are all sent right away. Each vehicle is processed as soon
+            # as its own details are there, while the details of the following vehicles are still being downloaded.
+            vehicle_details: Dict[str, Future[Optional[Dict[str, Any]]]] = \
+                {vehicle_dict['vin']: self._executor.submit(self._fetch_vehicle_details, vehicle_dict['vin']) for vehicle_dict in vehicle_list
+                 if vehicle_dict.get('vin') is not None and vehicle_dict['vin'] not in hide_vins}
+            for vehicle_dict in vehicle_list:
+                vin: Optional[str] = vehicle_dict.get('vin')
+                if vin is None:
+                    raise APIError('Could not fetch vehicle data, VIN missing')
+                if vin in hide_vins:
+                    LOG.warning('Vehicle %s is hidden in config', vin)
+                    continue
+                seen_vehicle_vins.add(vin)
+                vehicle: Optional[GenericVehicle] = get_vehicle(vin)  # pyright: ignore[reportAssignmentType]
+                if vehicle is None:
+                    vehicle = VolvoVehicle(vin=vin, garage=garage, managing_connector=self, initialization=garage.get_initialization(vin))
+                    garage.add_vehicle(vin, vehicle)
+
+                vehicle_data: Optional[Dict[str, Any]] = vehicle_details[vin].result()
+                vehicle_info: Optional[Dict[str, Any]] = vehicle_data.get('data') if vehicle_data is not None else None
+                if vehicle_info is None:
+                    continue
+
+                model_year = vehicle_info.get('modelYear')
+                if model_year is not None:
+                    _set_if_changed(vehicle.model_year, model_year)
+
+                gearbox: Optional[str] = vehicle_info.get('gearbox')
+                if gearbox is not None:
+                    gearbox_type: Optional[GenericVehicle.VehicleSpecification.GearboxType] = _GEARBOX_TYPES.get(gearbox)
+                    if gearbox_type is None:
+                        LOG_API.warning('Unknown gearbox type: %s', gearbox)
+                        gearbox_type = GenericVehicle.VehicleSpecification.GearboxType.UNKNOWN
+                    _set_if_changed(vehicle.specification.gearbox, gearbox_type)
+
+                fuel_type: Optional[str] = vehicle_info.get('fuelType')
+                if fuel_type is not None:
+                    if (car_type := _VEHICLE_TYPES.get(fuel_type)) is not None:
+                        _set_if_changed(vehicle.type, car_type)
+                    elif fuel_type == 'PETROL/ELECTRIC':
+                        _set_if_changed(vehicle.type, GenericVehicle.Type.HYBRID)
                     else:
-                        raise APIError('Could not fetch vehicle data, VIN missing')
-        for vin in set(garage.list_vehicle_vins()) - seen_vehicle_vins:
+                        _set_if_changed(vehicle.type, GenericVehicle.Type.UNKNOWN)
+                        LOG_API.warning('Unknown fuel type: %s', fuel_type)
+                    vehicle_class: Optional[Type[VolvoVehicle]] = _VEHICLE_CLASS_FOR_TYPE.get(vehicle.type.value)
+                    # A hybrid vehicle is an electric and a combustion vehicle as well, so it is not demoted again
+                    if vehicle_class is not None and not isinstance(vehicle, vehicle_class):
+                        LOG.debug('Promoting %s to %s object for %s', vehicle.__class__.__name__, vehicle_class.__name__, vin)
+                        vehicle = vehicle_class(garage=garage, origin=vehicle)
+                        garage.replace_vehicle(vin, vehicle)
+
+                descriptions: Optional[Dict[str, Any]] = vehicle_info.get('descriptions')
+                if descriptions is not None:
+                    model: Optional[str] = descriptions.get('model')
+                    if model is not None:
+                        _set_if_changed(vehicle.model, model)
+
+                    steering: Optional[str] = descriptions.get('steering')
+                    if steering is not None:
+                        steering_position: Optional[GenericVehicle.VehicleSpecification.SteeringPosition] = _STEERING_MAP.get(steering)
+                        if steering_position is None:
+                            LOG_API.warning('Unknown steering position: %s', steering)
+                            steering_position = GenericVehicle.VehicleSpecification.SteeringPosition.UNKNOWN
+                        _set_if_changed(vehicle.specification.steering_wheel_position, steering_position)
+                    if LOG_API.isEnabledFor(logging.INFO):
+                        log_extra_keys(LOG_API, 'descriptions', descriptions, _DESCRIPTION_KEYS)  # pyright: ignore[reportArgumentType]
+
+                images: Optional[Dict[str, str]] = vehicle_info.get('images')
+                if SUPPORT_IMAGES and images is not None:
+                    # fetch vehcile images in parallel, the results are applied to the vehicle on this thread
+                    image_futures: Dict[str, Future[Optional[bytes]]] = {
+                        image_id: submit_image(fetch_image, image_url, image_session, image_cache)
+                        for image_id, image_url in images.items()}
+                    for image_id, image_future in image_futures.items():
+                        raw_image: Optional[bytes] = image_future.result()
+                        if raw_image is not None:
+                            # Image.open only reads the header, pixel data is decoded when the image is first used
+                            try:
+                                img = Image.open(io.BytesIO(raw_image))  # pyright: ignore[reportPossiblyUnboundVariable]
+                            except OSError:  # PIL's UnidentifiedImageError is an OSError
+                                # E.g. an error page sent with status 200, it must not be served from the cache until it expires
+                                LOG.error('Could not read image %s from %s', image_id, images[image_id])
+                                if image_cache is not None:
+                                    image_cache.pop(_bytes_cache_key(images[image_id]), None)
+                                continue
+                            vehicle._car_images[image_id] = img  # pylint: disable=protected-access
+                            if image_id == 'exteriorImageUrl':
+                                if (car_picture := vehicle.images.images.get('car_picture')) is not None:
+                                    car_picture._set_value(img)  # pylint: disable=protected-access
+                                else:
+                                    vehicle.images.images['car_picture'] = ImageAttribute(name="car_picture", parent=vehicle.images,
+                                                                                          value=img, tags={'carconnectivity'})
+                if LOG_API.isEnabledFor(logging.INFO):
+                    log_extra_keys(LOG_API, 'https://api.volvocars.com/connected-vehicle/v2/vehicles/{vin}', vehicle_info,
+                                   _VEHICLE_DETAIL_KEYS)  # pyright: ignore[reportArgumentType]
+        stale_vehicle_vins.difference_update(seen_vehicle_vins)
+        for vin in stale_vehicle_vins:
             vehicle_to_remove = garage.get_vehicle(vin)
             if vehicle_to_remove is not None and vehicle_to_remove.is_managed_by_connector(self):
                 garage.remove_vehicle(vin)
-        self.update_vehicles()
+                # Should the vehicle come back, it is a new object that needs all data again
+                self._delivered_urls = {url for url in self._delivered_urls if vin not in url}
+
+    def _fetch_vehicle_details(self, vin: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetches the details of a single vehicle. Called from worker threads by fetch_vehicles.
+
+        Args:
+            vin (str): The VIN of the vehicle.
+
+        Returns:
+            Optional[Dict[str, Any]]: The response of the vehicle details endpoint.
+        """
+        url: str = f'https://api.volvocars.com/connected-vehicle/v2/vehicles/{vin}'
+        # {'data': {'vin': 'YV4952NA4F120DEMO', 'modelYear': 2019, 'gearbox': 'AUTOMATIC', 'fuelType': 'DIESEL', 'externalColour': 'SAVILE GREY', 'batteryCapacityKWH': 78.0, 'images': {'exteriorImageUrl': 'https://cas.volvocars.com/image/vbsnext-v4/exterior/MY19_1817/225/A8/13/49200/R131/_/TP02/_/_/TM02/JT02_f13/SR02/_/_/JB0C/T206/default.png?market=us&client=connected-vehicle-api&w=1920&bg=00000000&angle=0&fallback', 'internalImageUrl': 'https://cas.volvocars.com/image/vbsnext-v4/interior/MY19_1817/225/1/RC0000_f13/NC04/DI02/RU06/_/_/FJ01/EV02/K502/default.png?market=us&client=connected-vehicle-api&w=1920&bg=00000000&angle=0&fallback'}, 'descriptions': {'model': 'V60 II', 'upholstery': 'CHARCOAL/LEAC/CHARC', 'steering': 'LEFT'}}}
+        return self._fetch_data(url, session=self.connected_vehicle_session, ttl=self._vehicle_detail_max_age)
 
     def decide_state(self, vehicle: GenericVehicle) -> GenericVehicle:
         """
@@ -420,6 +777,70 @@ class Connector(BaseConnector):
         return vehicle
 
 
+    def _status_url(self, vehicle: GenericVehicle, endpoint: str) -> str:
+        """
+        Returns the URL of a status endpoint of the given vehicle.
+
+        Args:
+            vehicle (GenericVehicle): The vehicle.
+            endpoint (str): The endpoint, one of the keys of _VEHICLE_URL_TEMPLATES.
+
+        Raises:
+            ValueError: If the vehicle's VIN is None.
+
+        Returns:
+            str: The URL.
+        """
+        vin = vehicle.vin.value
+        if vin is None:
+            raise ValueError('vehicle.vin cannot be None')
+        return _vehicle_url(vehicle, vin, endpoint)
+
+    def _fetch_status(self, vehicle: GenericVehicle, endpoint: str, session: Optional[VolvoSession],
+                      update: Callable[[GenericVehicle, Union[Dict[str, Any], None, FetchResult]], GenericVehicle]) -> GenericVehicle:
+        """
+        Fetches a status endpoint of the given vehicle and applies the response.
+
+        Args:
+            vehicle (GenericVehicle): The vehicle.
+            endpoint (str): The endpoint, one of the keys of _VEHICLE_URL_TEMPLATES.
+            session (Optional[VolvoSession]): The session used for the request.
+            update (Callable): Applies the response to the vehicle.
+
+        Raises:
+            ValueError: If there is no session, e.g. no location token is configured, or the vehicle's VIN is None.
+
+        Returns:
+            GenericVehicle: The updated vehicle.
+        """
+        if session is None:
+            raise ValueError('No session for this endpoint')
+        url: str = self._status_url(vehicle, endpoint)
+        return self._apply_status(vehicle, url, self._fetch_data(url, session, allow_empty=True, allow_not_modified=True), update)
+
+    def _apply_status(self, vehicle: GenericVehicle, url: str, data: Union[Dict[str, Any], None, FetchResult],
+                      update: Callable[[GenericVehicle, Union[Dict[str, Any], None, FetchResult]], GenericVehicle]) -> GenericVehicle:
+        """
+        Applies the response of a status endpoint to the vehicle. The URL only counts as delivered once the response was applied
+        successfully, so a response that could not be applied is never skipped as unchanged.
+
+        Args:
+            vehicle (GenericVehicle): The vehicle.
+            url (str): The URL the response was fetched from.
+            data (Union[Dict[str, Any], None, FetchResult]): The response as returned by _fetch_data.
+            update (Callable): Applies the response to the vehicle.
+
+        Returns:
+            GenericVehicle: The updated vehicle.
+        """
+        try:
+            update(vehicle, data)
+        except Exception:
+            self._delivered_urls.discard(url)
+            raise
+        self._delivered_urls.add(url)
+        return vehicle
+
     def fetch_position(self, vehicle: GenericVehicle) -> GenericVehicle:
         """
         Fetches the parking position of the given volvo vehicle and updates the vehicle's position attributes.
@@ -435,142 +856,115 @@ class Connector(BaseConnector):
             vehicle.position.latitude: The latitude of the vehicle's parking position.
             vehicle.position.longitude: The longitude of the vehicle's parking position.
         """
-        vin = vehicle.vin.value
-        if vin is None:
-            raise ValueError('vehicle.vin cannot be None')
-        url: str = f'https://api.volvocars.com/location/v1/vehicles/{vin}/location'
-        data: Dict[str, Any] | None = self._fetch_data(url, self.location_session, allow_empty=True)
-        if data is not None and 'data' in data and data['data'] is not None:
-            if 'type' in data['data'] and data['data']['type'] == 'Feature':
-                if 'properties' in data['data'] and data['data']['properties'] is not None:
-                    if 'heading' in data['data']['properties'] and data['data']['properties']['heading'] is not None:
-                        vehicle.position.heading._set_value(data['data']['properties']['heading'])  # pylint: disable=protected-access
-                    else:
-                        vehicle.position.heading._set_value(None)  # pylint: disable=protected-access
-                    if 'timestamp' in data['data']['properties'] and data['data']['properties']['timestamp'] is not None:
-                        captured_at: datetime = robust_time_parse(data['data']['properties']['timestamp'])
-                    else:
-                        raise APIError('Could not fetch position, timestamp missing')
-                    if 'geometry' in data['data'] and data['data']['geometry'] is not None and data['data']['geometry']['type'] == 'Point':
-                        if 'coordinates' in data['data']['geometry'] and data['data']['geometry']['coordinates'] is not None:
-                            vehicle.position.latitude._set_value(data['data']['geometry']['coordinates'][1], measured=captured_at)  # pylint: disable=protected-access
-                            vehicle.position.longitude._set_value(data['data']['geometry']['coordinates'][0], measured=captured_at)  # pylint: disable=protected-access
-                            vehicle.position.altitude._set_value(data['data']['geometry']['coordinates'][2], measured=captured_at)  # pylint: disable=protected-access
-                            vehicle.position.position_type._set_value(Position.PositionType.PARKING, measured=captured_at)  # pylint: disable=protected-access
-                    else:
-                        vehicle.position.latitude._set_value(None)  # pylint: disable=protected-access
-                        vehicle.position.longitude._set_value(None)  # pylint: disable=protected-access
-                        vehicle.position.altitude._set_value(None)  # pylint: disable=protected-access
-                        vehicle.position.position_type._set_value(None)  # pylint: disable=protected-access
+        return self._fetch_status(vehicle, 'location', self.location_session, self._update_position)
+
+    def _update_position(self, vehicle: GenericVehicle, data: Union[Dict[str, Any], None, FetchResult]) -> GenericVehicle:
+        if data is FetchResult.NOT_MODIFIED:
+            return vehicle
+        position: Position = vehicle.position
+        if data is not None and (location := data.get('data')) is not None:
+            if location.get('type') == 'Feature' and (properties := location.get('properties')) is not None:
+                position.heading._set_value(properties.get('heading'))  # pylint: disable=protected-access
+                captured_at: datetime = _required_timestamp(properties, 'position')
+                geometry: Optional[Dict[str, Any]] = location.get('geometry')
+                if geometry is not None and geometry['type'] == 'Point':
+                    if (coordinates := geometry.get('coordinates')) is not None:
+                        _set_position(position, coordinates, Position.PositionType.PARKING, captured_at)
+                else:
+                    _clear_position(position)
         else:
-            vehicle.position.latitude._set_value(None)  # pylint: disable=protected-access
-            vehicle.position.longitude._set_value(None)  # pylint: disable=protected-access
-            vehicle.position.altitude._set_value(None)  # pylint: disable=protected-access
-            vehicle.position.position_type._set_value(None)  # pylint: disable=protected-access
+            _clear_position(position)
         return vehicle
 
     def fetch_windows(self, vehicle: GenericVehicle) -> GenericVehicle:
-        vin = vehicle.vin.value
-        if vin is None:
-            raise ValueError('vehicle.vin cannot be None')
-        url: str = f'https://api.volvocars.com/connected-vehicle/v2/vehicles/{vin}/windows'
-        data: Dict[str, Any] | None = self._fetch_data(url, self.connected_vehicle_session, allow_empty=True)
+        return self._fetch_status(vehicle, 'windows', self.connected_vehicle_session, self._update_windows)
+
+    def _update_windows(self, vehicle: GenericVehicle, data: Union[Dict[str, Any], None, FetchResult]) -> GenericVehicle:
+        if data is FetchResult.NOT_MODIFIED:
+            return vehicle
         seen_window_ids: set[str] = set()
-        if data is not None and 'data' in data and data['data'] is not None:
-            for window_id, window_dict in data['data'].items():
+        if data is not None and (windows := data.get('data')) is not None:
+            for window_id, window_dict in windows.items():
                 window_id = window_id.replace('Window', '')
                 seen_window_ids.add(window_id)
-                if window_id in vehicle.windows.windows:
-                    window: Windows.Window = vehicle.windows.windows[window_id]
-                else:
+                window: Optional[Windows.Window] = vehicle.windows.windows.get(window_id)
+                if window is None:
                     window = Windows.Window(window_id=window_id, windows=vehicle.windows, initialization=vehicle.windows.get_initialization(window_id))
                     vehicle.windows.windows[window_id] = window
-                if 'timestamp' in window_dict and window_dict['timestamp'] is not None:
-                    captured_at: datetime = robust_time_parse(window_dict['timestamp'])
-                else:
-                    raise APIError('Could not fetch window, timestamp missing')
-                if 'value' in window_dict and window_dict['value'] is not None:
-                    if window_dict['value'] in [item.name for item in Windows.OpenState]:
-                        window.open_state._set_value(Windows.OpenState[window_dict['value']], measured=captured_at)  # pylint: disable=protected-access
-                    else:
-                        window.open_state._set_value(Windows.OpenState.UNKNOWN, measured=captured_at)  # pylint: disable=protected-access
-                        LOG_API.warning('Unknown window state: %s', window_dict['value'])
+                captured_at: datetime = _required_timestamp(window_dict, 'window')
+                if (value := window_dict.get('value')) is not None:
+                    window_state: Optional[Windows.OpenState] = _WINDOW_OPEN_STATES.get(value)
+                    if window_state is None:
+                        LOG_API.warning('Unknown window state: %s', value)
+                        window_state = Windows.OpenState.UNKNOWN
+                    window.open_state._set_value(window_state, measured=captured_at)  # pylint: disable=protected-access
                 else:
                     window.open_state._set_value(None)  # pylint: disable=protected-access
-        for window_id in vehicle.windows.windows.keys() - seen_window_ids:
-            vehicle.windows.windows[window_id].enabled = False
+        # Windows not in the response are disabled
+        for window_id, window in vehicle.windows.windows.items():
+            if window_id not in seen_window_ids:
+                window.enabled = False
         return vehicle
 
     def fetch_doors(self, vehicle: GenericVehicle) -> GenericVehicle:
-        vin = vehicle.vin.value
-        if vin is None:
-            raise ValueError('vehicle.vin cannot be None')
-        url: str = f'https://api.volvocars.com/connected-vehicle/v2/vehicles/{vin}/doors'
-        data: Dict[str, Any] | None = self._fetch_data(url, self.connected_vehicle_session, allow_empty=True)
+        return self._fetch_status(vehicle, 'doors', self.connected_vehicle_session, self._update_doors)
+
+    def _update_doors(self, vehicle: GenericVehicle, data: Union[Dict[str, Any], None, FetchResult]) -> GenericVehicle:
+        if data is FetchResult.NOT_MODIFIED:
+            return vehicle
         seen_door_ids: set[str] = set()
-        if data is not None and 'data' in data and data['data'] is not None:
-            any_door_open: bool = False
-            for door_id, door_dict in data['data'].items():
+        if data is not None and (doors := data.get('data')) is not None:
+            for door_id, door_dict in doors.items():
                 door_id = door_id.replace('Door', '')
+                value: Optional[str] = door_dict.get('value')
                 if door_id == 'centralLock':
-                    if 'value' in door_dict and door_dict['value'] is not None:
-                        if door_dict['value'] == "LOCKED":
-                            vehicle.doors.lock_state._set_value(Doors.LockState.LOCKED)  # pylint: disable=protected-access
-                        elif door_dict['value'] == "UNLOCKED":
-                            vehicle.doors.lock_state._set_value(Doors.LockState.UNLOCKED)  # pylint: disable=protected-access
-                        else:
-                            vehicle.doors.lock_state._set_value(Doors.LockState.UNKNOWN)  # pylint: disable=protected-access
+                    if value is not None:
+                        vehicle.doors.lock_state._set_value(_LOCK_STATE_MAP.get(value, Doors.LockState.UNKNOWN))  # pylint: disable=protected-access
                 else:
                     seen_door_ids.add(door_id)
-                    if door_id in vehicle.doors.doors:
-                        door: Doors.Door = vehicle.doors.doors[door_id]
-                    else:
+                    door: Optional[Doors.Door] = vehicle.doors.doors.get(door_id)
+                    if door is None:
                         door = Doors.Door(door_id=door_id, doors=vehicle.doors, initialization=vehicle.doors.get_initialization(door_id))
                         vehicle.doors.doors[door_id] = door
-                    if 'timestamp' in door_dict and door_dict['timestamp'] is not None:
-                        captured_at: datetime = robust_time_parse(door_dict['timestamp'])
-                    else:
-                        raise APIError('Could not fetch door, timestamp missing')
-                    if 'value' in door_dict and door_dict['value'] is not None:
-                        if door_dict['value'] == "UNSPECIFIED":
+                    captured_at: datetime = _required_timestamp(door_dict, 'door')
+                    if value is not None:
+                        if value == "UNSPECIFIED":
                             door.open_state._set_value(Doors.OpenState.UNKNOWN, measured=captured_at)  # pylint: disable=protected-access
-                        elif door_dict['value'] in [item.name for item in Doors.OpenState]:
-                            door.open_state._set_value(Doors.OpenState[door_dict['value']], measured=captured_at)  # pylint: disable=protected-access
+                        elif (door_state := _DOOR_OPEN_STATES.get(value)) is not None:
+                            door.open_state._set_value(door_state, measured=captured_at)  # pylint: disable=protected-access
                         else:
                             door.open_state._set_value(Windows.OpenState.UNKNOWN, measured=captured_at)  # pylint: disable=protected-access
-                            LOG_API.warning('Unknown door state: %s', door_dict['value'])
-                        if door.open_state.value in [Doors.OpenState.OPEN, Doors.OpenState.AJAR]:
-                            any_door_open = True
+                            LOG_API.warning('Unknown door state: %s', value)
                     else:
                         door.open_state._set_value(None)  # pylint: disable=protected-access
-                    door.lock_state._set_value(vehicle.doors.lock_state.value)  # pylint: disable=protected-access
-            if any_door_open:
+            # Doors report the central lock state, set once all entries are read as centralLock may come after the doors
+            lock_state: Optional[Doors.LockState] = vehicle.doors.lock_state.value
+            for door_id in seen_door_ids:
+                vehicle.doors.doors[door_id].lock_state._set_value(lock_state)  # pylint: disable=protected-access
+            if any(vehicle.doors.doors[door_id].open_state.value in _OPEN_DOOR_STATES for door_id in seen_door_ids):
                 vehicle.doors.open_state._set_value(Doors.OpenState.OPEN)  # pylint: disable=protected-access
             else:
                 vehicle.doors.open_state._set_value(Doors.OpenState.CLOSED)  # pylint: disable=protected-access
-        for door_id in vehicle.doors.doors.keys() - seen_door_ids:
-            vehicle.doors.doors[door_id].enabled = False
+        # Doors not in the response are disabled
+        for door_id, door in vehicle.doors.doors.items():
+            if door_id not in seen_door_ids:
+                door.enabled = False
         return vehicle
 
     def fetch_odometer(self, vehicle: GenericVehicle) -> GenericVehicle:
-        vin = vehicle.vin.value
-        if vin is None:
-            raise ValueError('vehicle.vin cannot be None')
-        url: str = f'https://api.volvocars.com/connected-vehicle/v2/vehicles/{vin}/odometer'
-        data: Dict[str, Any] | None = self._fetch_data(url, self.connected_vehicle_session, allow_empty=True)
-        if data is not None and 'data' in data and data['data'] is not None:
-            if 'odometer' in data['data'] and data['data']['odometer'] is not None:
-                if 'timestamp' in data['data']['odometer'] and data['data']['odometer']['timestamp'] is not None:
-                    captured_at: datetime = robust_time_parse(data['data']['odometer']['timestamp'])
-                else:
-                    raise APIError('Could not fetch odometer, timestamp missing')
-                if 'unit' in data['data']['odometer'] and data['data']['odometer']['unit'] is not None and data['data']['odometer']['unit'] == 'km':
-                    unit = Length.KM
-                else:
-                    unit = Length.KM
-                    LOG_API.warning('Unknown odometer unit: %s', data['data']['odometer']['unit'])
-                if 'value' in data['data']['odometer'] and data['data']['odometer']['value'] is not None:
-                    vehicle.odometer._set_value(data['data']['odometer']['value'], measured=captured_at, unit=unit)  # pylint: disable=protected-access
+        return self._fetch_status(vehicle, 'odometer', self.connected_vehicle_session, self._update_odometer)
+
+    def _update_odometer(self, vehicle: GenericVehicle, data: Union[Dict[str, Any], None, FetchResult]) -> GenericVehicle:
+        if data is FetchResult.NOT_MODIFIED:
+            return vehicle
+        if data is not None and (odometer_data := data.get('data')) is not None and (odometer := odometer_data.get('odometer')) is not None:
+            captured_at: datetime = _required_timestamp(odometer, 'odometer')
+            unit: Optional[Length] = _LENGTH_UNIT_MAP.get(odometer.get('unit'))
+            if unit is None:
+                LOG_API.warning('Unknown odometer unit: %s', odometer.get('unit'))
+                unit = Length.KM
+            if (value := odometer.get('value')) is not None:
+                vehicle.odometer._set_value(value, measured=captured_at, unit=unit)  # pylint: disable=protected-access
         return vehicle
 
     def _record_elapsed(self, elapsed: timedelta) -> None:
@@ -582,54 +976,182 @@ class Connector(BaseConnector):
         """
         self._elapsed.append(elapsed)
 
-    def _fetch_data(self, url, session, force=False, allow_empty=False, allow_http_error=False, allowed_errors=None) -> Optional[Dict[str, Any]]:  # noqa: C901
+    def _ttl_for(self, url: str) -> Optional[timedelta]:
+        """
+        Returns how long the response for the given URL may be cached.
+
+        Args:
+            url (str): The URL of the request.
+
+        Returns:
+            Optional[timedelta]: The cache lifetime, None if caching is disabled.
+        """
+        if self._max_age_delta is None:
+            return None
+        if url in self._ttl_rule_by_url:
+            rule_ttl: Optional[timedelta] = self._ttl_rule_by_url[url]
+        else:
+            rule_ttl = next((ttl for pattern, ttl in _TTL_RULES if pattern.search(url)), None)
+            self._ttl_rule_by_url[url] = rule_ttl
+        if rule_ttl is None or rule_ttl < self._max_age_delta:
+            return self._max_age_delta
+        return rule_ttl
+
+    def _fetch_cached_bytes(self, url: str, session: requests.Session, cache: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """
+        Fetches binary content, e.g. vehicle images, using the given cache.
+        The cache holds the downloaded bytes as is (base64 encoded, as the cache is stored as JSON) under a short hash of the URL,
+        as e.g. image URLs are several hundred characters long. If downloading fails, an outdated cache entry is returned instead.
+
+        Args:
+            url (str): The URL to fetch.
+            session (requests.Session): The session used for downloading.
+            cache (Optional[Dict[str, Any]]): The cache to look up and store the content in.
+
+        Returns:
+            Optional[bytes]: The content, None if it could neither be downloaded nor found in the cache.
+        """
+        max_age: Optional[timedelta] = self._ttl_for(url)
+        cache_key: str = _bytes_cache_key(url)
+        cached_content: Optional[str] = None
+        if cache is not None and url in cache:
+            # Entries written by older versions are keyed by the URL itself
+            cache[cache_key] = cache.pop(url)
+        if max_age is not None and cache is not None:
+            cache_entry = cache.get(cache_key)
+            if cache_entry is not None:
+                cached_content = cache_entry[0]
+                if cached_content is not None and time.time() - _cache_timestamp(cache, cache_key, cache_entry) <= max_age.total_seconds():
+                    return base64.b64decode(cached_content)
+        try:
+            response: requests.Response = session.get(url, timeout=_DOWNLOAD_TIMEOUT)
+        except _REQUEST_ERRORS as request_error:
+            raise _retrieval_error(request_error) from request_error
+        if response.status_code == _HTTP_OK:
+            content: bytes = response.content
+            # Without a max age a cached entry would never be read again
+            if max_age is not None and cache is not None:
+                cache[cache_key] = (base64.b64encode(content).decode('ascii'), time.time())
+            return content
+        LOG.error('Could not fetch %s. Status Code was: %d', url, response.status_code)
+        if cached_content is not None:
+            return base64.b64decode(cached_content)
+        return None
+
+    def _fetch_data(  # noqa: C901  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            self, url: str, session: VolvoSession, force: bool = False, allow_empty: bool = False, allow_http_error: bool = False,
+            allowed_errors: Optional[List[int]] = None, ttl: Optional[timedelta] = None,
+            allow_not_modified: bool = False) -> Union[Dict[str, Any], None, FetchResult]:
+        """
+        Fetches JSON data from the given URL, using the cache of the session.
+
+        Args:
+            url (str): The URL to fetch.
+            session (VolvoSession): The session used for the request.
+            force (bool): Ignore cached data and always ask the server.
+            allow_empty (bool): Return None instead of raising an error if the response is empty.
+            allow_http_error (bool): Do not raise an error for unsuccessful status codes.
+            allowed_errors (Optional[List[int]]): If allow_http_error is set, only these status codes are accepted.
+            ttl (Optional[timedelta]): How long cached data is fresh, defaults to the lifetime configured for the URL. Ignored if
+                caching is disabled.
+            allow_not_modified (bool): Return FetchResult.NOT_MODIFIED if the server reports that the data did not change since
+                it was last applied, so the caller can skip updating its attributes. Callers mark the URL as applied in
+                _delivered_urls once they processed the data successfully.
+
+        Returns:
+            Union[Dict[str, Any], None, FetchResult]: The parsed data, None if there is none.
+        """
+        # max_age set to None in the config disables caching, this also applies to an explicit ttl
+        max_age: Optional[timedelta] = ttl if ttl is not None and self._max_age_delta is not None else self._ttl_for(url)
         data: Optional[Dict[str, Any]] = None
-        cache_date: Optional[datetime] = None
-        if not force and (self.active_config['max_age'] is not None and session.cache is not None and url in session.cache):
-            data, cache_date_string = session.cache[url]
-            cache_date = datetime.fromisoformat(cache_date_string)
-        if data is None or self.active_config['max_age'] is None \
-                or (cache_date is not None and cache_date < (datetime.utcnow() - timedelta(seconds=self.active_config['max_age']))):
-            try:
-                status_response: requests.Response = session.get(url, allow_redirects=False)
-                self._record_elapsed(status_response.elapsed)
-                if status_response.status_code in (requests.codes['ok'], requests.codes['multiple_status']):
-                    data = status_response.json()
+        etag: Optional[str] = None
+        last_modified: Optional[str] = None
+        digest: Optional[str] = None
+        if not force and max_age is not None and session.cache is not None:
+            cache_entry: Optional[Tuple[Any, ...]] = session.cache.get(url)
+            if cache_entry is not None:
+                # Entries written by older versions only contain data and date
+                data = cache_entry[0]
+                if len(cache_entry) >= 4:
+                    etag, last_modified = cache_entry[2], cache_entry[3]
+                if len(cache_entry) >= 5:
+                    digest = cache_entry[4]
+                # Fresh data is returned right away, everything below is only needed when asking the server
+                if data is not None and time.time() - _cache_timestamp(session.cache, url, cache_entry) <= max_age.total_seconds():
+                    return data
+        # If the cached data is outdated, ask the server to only send the data if it changed
+        conditional_headers: Optional[Dict[str, str]] = None
+        if data is not None and (etag is not None or last_modified is not None):
+            conditional_headers = {}
+            if etag is not None:
+                conditional_headers['If-None-Match'] = etag
+            if last_modified is not None:
+                conditional_headers['If-Modified-Since'] = last_modified
+        not_modified: bool = False
+        try:
+            status_response: requests.Response = session.get(url, headers=conditional_headers, allow_redirects=False)
+            self._record_elapsed(status_response.elapsed)
+            if status_response.status_code == _HTTP_NOT_MODIFIED and conditional_headers is not None:
+                not_modified = True
+                if session.cache is not None:
+                    session.cache[url] = (data, time.time(), etag, last_modified, digest)
+            elif status_response.status_code in _HTTP_SUCCESS:
+                data, not_modified = self._parse_response(url, session, status_response, data, digest)
+            elif status_response.status_code == _HTTP_NO_CONTENT and allow_empty:
+                data = None
+            elif status_response.status_code == _HTTP_TOO_MANY_REQUESTS:
+                raise TooManyRequestsError('Could not fetch data due to too many requests from your account. '
+                                           f'Status Code was: {status_response.status_code}')
+            elif status_response.status_code == _HTTP_UNAUTHORIZED:
+                LOG.info('Server asks for new authorization')
+                session.login()
+                status_response = session.get(url, headers=conditional_headers, allow_redirects=False)
+
+                if status_response.status_code == _HTTP_NOT_MODIFIED and conditional_headers is not None:
+                    not_modified = True
                     if session.cache is not None:
-                        session.cache[url] = (data, str(datetime.utcnow()))
-                elif status_response.status_code == requests.codes['no_content'] and allow_empty:
-                    data = None
-                elif status_response.status_code == requests.codes['too_many_requests']:
-                    raise TooManyRequestsError('Could not fetch data due to too many requests from your account. '
-                                               f'Status Code was: {status_response.status_code}')
-                elif status_response.status_code == requests.codes['unauthorized']:
-                    LOG.info('Server asks for new authorization')
-                    session.login()
-                    status_response = session.get(url, allow_redirects=False)
-
-                    if status_response.status_code in (requests.codes['ok'], requests.codes['multiple_status']):
-                        data = status_response.json()
-                        if session.cache is not None:
-                            session.cache[url] = (data, str(datetime.utcnow()))
-                    elif not allow_http_error or (allowed_errors is not None and status_response.status_code not in allowed_errors):
-                        raise RetrievalError(f'Could not fetch data even after re-authorization. Status Code was: {status_response.status_code}')
+                        session.cache[url] = (data, time.time(), etag, last_modified, digest)
+                elif status_response.status_code in _HTTP_SUCCESS:
+                    data, not_modified = self._parse_response(url, session, status_response, data, digest)
                 elif not allow_http_error or (allowed_errors is not None and status_response.status_code not in allowed_errors):
-                    raise RetrievalError(f'Could not fetch data for {url}. Status Code was: {status_response.status_code}')
-            except requests.exceptions.ConnectionError as connection_error:
-                raise RetrievalError(f'Connection error: {connection_error}') from connection_error
-            except requests.exceptions.ChunkedEncodingError as chunked_encoding_error:
-                raise RetrievalError(f'Error: {chunked_encoding_error}') from chunked_encoding_error
-            except requests.exceptions.ReadTimeout as timeout_error:
-                raise RetrievalError(f'Timeout during read: {timeout_error}') from timeout_error
-            except requests.exceptions.RetryError as retry_error:
-                raise RetrievalError(f'Retrying failed: {retry_error}') from retry_error
-            except requests.exceptions.JSONDecodeError as json_error:
-                if allow_empty:
-                    data = None
-                else:
-                    raise RetrievalError(f'JSON decode error: {json_error}') from json_error
+                    raise RetrievalError(f'Could not fetch data even after re-authorization. Status Code was: {status_response.status_code}')
+            elif not allow_http_error or (allowed_errors is not None and status_response.status_code not in allowed_errors):
+                raise RetrievalError(f'Could not fetch data for {url}. Status Code was: {status_response.status_code}')
+        except _REQUEST_ERRORS as request_error:
+            raise _retrieval_error(request_error) from request_error
+        except json.JSONDecodeError as json_error:
+            if allow_empty:
+                data = None
+            else:
+                raise RetrievalError(f'JSON decode error: {json_error}') from json_error
+        if not_modified and allow_not_modified and url in self._delivered_urls:
+            return FetchResult.NOT_MODIFIED
         return data
 
+    @staticmethod
+    def _parse_response(url: str, session: VolvoSession, response: requests.Response, cached_data: Optional[Dict[str, Any]],
+                        cached_digest: Optional[str]) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Parses the body of a successful response and stores it in the cache of the session. Many servers do not support conditional
+        requests, so the body is compared to the cached one by its hash. An identical body is not parsed again.
+
+        Args:
+            url (str): The URL of the request, used as cache key.
+            session (VolvoSession): The session whose cache is updated.
+            response (requests.Response): The successful response.
+            cached_data (Optional[Dict[str, Any]]): The data cached for the URL, if any.
+            cached_digest (Optional[str]): The hash of the body the cached data was parsed from, if known.
+
+        Returns:
+            Tuple[Optional[Dict[str, Any]], bool]: The data and whether it is unchanged from the cached data.
+        """
+        digest: str = hashlib.blake2b(response.content, digest_size=8).hexdigest()
+        unchanged: bool = cached_data is not None and digest == cached_digest
+        data: Optional[Dict[str, Any]] = cached_data if unchanged else json_loads(response.content)
+        if session.cache is not None:
+            session.cache[url] = (data, time.time(), response.headers.get('ETag'), response.headers.get('Last-Modified'), digest)
+        return data, unchanged
+
     def get_version(self) -> str:
         return __version__
 
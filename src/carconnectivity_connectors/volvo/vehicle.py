@@ -33,11 +33,14 @@ class VolvoVehicle(GenericVehicle):  # pylint: disable=too-many-instance-attribu
             super().__init__(garage=garage, origin=origin, initialization=initialization)
             if SUPPORT_IMAGES:
                 self._car_images = origin._car_images
+            self._urls = origin._urls
         else:
             super().__init__(vin=vin, garage=garage, managing_connector=managing_connector, initialization=initialization)
             self.is_active = BooleanAttribute(name='is_active', parent=self, tags={'connector_custom'}, initialization=self.get_initialization('is_active'))
             if SUPPORT_IMAGES:
                 self._car_images: Dict[str, Image.Image] = {}
+            # API URLs of this vehicle by endpoint, built once on first use
+            self._urls: Dict[str, str] = {}
         self.manufacturer._set_value(value='Volvo')  # pylint: disable=protected-access
 
 